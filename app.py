@@ -1,15 +1,10 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import operator
 import sqlite3
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.svm import SVC
-from sklearn.metrics import accuracy_score, confusion_matrix, classification_report
-import plotly.express as px
-import plotly.graph_objects as go
+import threading
+import time
 
 # Page configuration
 st.set_page_config(
@@ -21,10 +16,127 @@ st.set_page_config(
 # Database setup
 DATABASE_FILE = 'students.db'
 
-def initialize_database():
-    """Initialize SQLite database"""
-    conn = sqlite3.connect(DATABASE_FILE)
+# Hot-path statements kept as fixed strings so the connection's statement
+# cache reuses the compiled statement instead of re-parsing on every call
+INSERT_STUDENT_SQL = '''
+    INSERT INTO students (
+        student_id, school_satisfaction, attendance_rate, failed_courses, 
+        commute_time, disciplinary_incidents, homework_completion, 
+        family_income, promotion_status
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    -- Upsert updates an existing row in place rather than deleting and reinserting it
+    ON CONFLICT(student_id) DO UPDATE SET
+        school_satisfaction = excluded.school_satisfaction,
+        attendance_rate = excluded.attendance_rate,
+        failed_courses = excluded.failed_courses,
+        commute_time = excluded.commute_time,
+        disciplinary_incidents = excluded.disciplinary_incidents,
+        homework_completion = excluded.homework_completion,
+        family_income = excluded.family_income,
+        promotion_status = excluded.promotion_status,
+        prediction_date = CURRENT_TIMESTAMP
+'''
+DELETE_STUDENT_SQL = 'DELETE FROM students WHERE student_id = ?'
+STUDENT_COLUMNS = (
+    "student_id, school_satisfaction, attendance_rate, failed_courses, commute_time, "
+    "disciplinary_incidents, homework_completion, family_income, promotion_status, prediction_date"
+)
+SELECT_STUDENTS_SQL = f"SELECT {STUDENT_COLUMNS} FROM students ORDER BY prediction_date DESC"
+STATUS_COUNTS_SQL = "SELECT promotion_status, COUNT(*) FROM students GROUP BY promotion_status"
+VIEW_METRICS_SQL = (
+    "SELECT COUNT(*), COALESCE(AVG(attendance_rate), 0), COALESCE(AVG(school_satisfaction), 0), "
+    "COALESCE(SUM(promotion_status = 'At Risk of Dropout'), 0) FROM students"
+)
+
+# Promotion rules as (label, display suffix, threshold, comparison), in
+# predict_promotion argument order; a student is promoted only if all pass
+FACTORS = (
+    ("School Satisfaction", "/5", 3, operator.gt),
+    ("Attendance Rate", "%", 70, operator.gt),
+    ("Failed Courses", "", 2, operator.le),
+    ("Commute Time", " min", 40, operator.le),
+    ("Disciplinary Cases", "", 2, operator.le),
+    ("Homework Completion", "%", 80, operator.gt),
+)
+
+# Batches this large are scored by the compiled Numba loop when Numba is installed
+NUMBA_MIN_ROWS = 100_000
+
+# Compact in-memory dtypes for student rows; nullable Int16 tolerates NULLs.
+# _fetch_students falls back to a plain numeric column if a cast is not exact
+STUDENT_DTYPES = {
+    'school_satisfaction': 'float32',
+    'attendance_rate': 'float32',
+    'homework_completion': 'float32',
+    'failed_courses': 'Int16',
+    'commute_time': 'Int16',
+    'disciplinary_incidents': 'Int16',
+    'family_income': 'category',
+    'promotion_status': 'category',
+}
+
+# Cap on points sent to the browser per Plotly scatter
+PLOT_MAX_POINTS = 5000
+
+# Rows fetched per page on View Database
+PAGE_SIZE = 100
+
+INCOME_LEVELS = ["low", "medium", "high"]
+
+# Valid (min, max) for each predictor; shared by the Predict form and CSV validation
+INPUT_RANGES = {
+    'school_satisfaction': (1.0, 5.0),
+    'attendance_rate': (0.0, 100.0),
+    'failed_courses': (0, 10),
+    'commute_time': (1, 120),
+    'disciplinary_incidents': (0, 10),
+    'homework_completion': (0.0, 100.0),
+}
+
+# Columns expected in a batch-prediction CSV, in predict_promotion argument order
+BATCH_COLUMNS = [
+    'student_id', 'school_satisfaction', 'attendance_rate', 'failed_courses',
+    'commute_time', 'disciplinary_incidents', 'homework_completion', 'family_income'
+]
+# Batch columns stored as INTEGER; rows with fractional values are rejected
+BATCH_INTEGER_COLUMNS = ['student_id', 'failed_courses', 'commute_time', 'disciplinary_incidents']
+# Predictor dtypes score_batch_csv produces; the Numba kernel is compiled for exactly these
+SCORING_DTYPES = tuple(
+    np.int64 if c in BATCH_INTEGER_COLUMNS else np.float64 for c in BATCH_COLUMNS[1:-1]
+)
+
+@st.cache_resource
+def get_conn():
+    """Shared long-lived write connection so SQLite's page cache stays warm across reruns"""
+    conn = sqlite3.connect(DATABASE_FILE, check_same_thread=False)
+    initialize_database(conn)
+    return conn
+
+@st.cache_resource
+def get_read_conn():
+    """Read-only connection for cached loaders; under WAL it sees only committed rows"""
+    get_conn()  # make sure the database and schema exist first
+    conn = sqlite3.connect(f"file:{DATABASE_FILE}?mode=ro", uri=True, check_same_thread=False)
+    configure_connection(conn)
+    return conn
+
+@st.cache_resource
+def get_write_lock():
+    """Process-wide write lock; every session shares get_conn()'s transaction state"""
+    return threading.Lock()
+
+def configure_connection(conn):
+    """Per-connection PRAGMAs shared by the write and read connections"""
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=134217728")
+
+def initialize_database(conn):
+    """Initialize SQLite database; runs once, when get_conn() opens the connection"""
     cursor = conn.cursor()
+    # WAL lets readers proceed alongside a writer; NORMAL sync is safe under WAL
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    configure_connection(conn)
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS students (
         student_id INTEGER PRIMARY KEY,
@@ -39,89 +151,308 @@ def initialize_database():
         prediction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     );
     ''')
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_students_status_income "
+        "ON students(promotion_status, family_income)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_students_date ON students(prediction_date DESC)"
+    )
     conn.commit()
-    conn.close()
+
+@st.cache_resource
+def _numba_scorer():
+    """Compile the fused scoring loop once per process, eagerly via its signature"""
+    try:
+        from numba import njit, prange
+    except ImportError:  # Numba is optional; NumPy scores batches without it
+        return None
+    
+    # Thresholds come from FACTORS and are frozen into the kernel as constants; the
+    # comparisons below are spelled out, so refuse to build if FACTORS disagrees
+    kernel_comparisons = (operator.gt, operator.gt, operator.le, operator.le, operator.le, operator.gt)
+    if tuple(f[3] for f in FACTORS) != kernel_comparisons:
+        raise RuntimeError("FACTORS comparisons no longer match the Numba scoring kernel")
+    sat_min, att_min, failed_max, commute_max, disc_max, hw_min = (f[2] for f in FACTORS)
+    
+    # Integer rules read int64 columns in place; cache=True lets later processes load
+    # the compiled kernel from __pycache__ instead of recompiling it
+    signature = "void({}, boolean[::1])".format(
+        ", ".join(f"{np.dtype(d).name}[::1]" for d in SCORING_DTYPES)
+    )
+    
+    def score(satisfaction, attendance, failed_courses, commute, disciplinary, homework, out):
+        for i in prange(satisfaction.shape[0]):
+            out[i] = (satisfaction[i] > sat_min and attendance[i] > att_min and
+                      failed_courses[i] <= failed_max and commute[i] <= commute_max and
+                      disciplinary[i] <= disc_max and homework[i] > hw_min)
+    
+    try:
+        return njit(signature, parallel=True, cache=True)(score)
+    except Exception:  # the on-disk cache could not be written; compile in memory only
+        return njit(signature, parallel=True)(score)
+
+def predict_promotion_vec(satisfaction, attendance, failed_courses, commute, disciplinary, homework):
+    """Rule-based prediction over whole arrays of students"""
+    values = (satisfaction, attendance, failed_courses, commute, disciplinary, homework)
+    scorer = _numba_scorer() if len(satisfaction) >= NUMBA_MIN_ROWS else None
+    if scorer is not None:
+        # No-op for score_batch_csv output, which already has these dtypes
+        columns = [np.ascontiguousarray(v, dtype=d) for v, d in zip(values, SCORING_DTYPES)]
+        promoted = np.empty(len(satisfaction), dtype=np.bool_)
+        scorer(*columns, promoted)
+    else:
+        promoted = np.logical_and.reduce([
+            passes(v, threshold) for (_, _, threshold, passes), v in zip(FACTORS, values)
+        ])
+    return np.where(promoted, "Promoted", "At Risk of Dropout")
 
 def predict_promotion(satisfaction, attendance, failed_courses, commute, disciplinary, homework, income):
     """Simple rule-based prediction"""
-    if (satisfaction > 3 and attendance > 70 and failed_courses <= 2 and
-        commute <= 40 and disciplinary <= 2 and homework > 80):
-        return "Promoted"
-    else:
-        return "At Risk of Dropout"
+    values = (satisfaction, attendance, failed_courses, commute, disciplinary, homework)
+    return str(predict_promotion_vec(*(np.array([v]) for v in values))[0])
 
 def insert_student_data(student_id, satisfaction, attendance, failed_courses, 
                        commute, disciplinary, homework, family_income, promotion_status):
     """Insert student data into database"""
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO students (
-                student_id, school_satisfaction, attendance_rate, failed_courses, 
-                commute_time, disciplinary_incidents, homework_completion, 
-                family_income, promotion_status
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (student_id, satisfaction, attendance, failed_courses, commute,
-              disciplinary, homework, family_income, promotion_status))
-        conn.commit()
-        conn.close()
+        conn = get_conn()
+        with get_write_lock(), conn:
+            conn.execute(INSERT_STUDENT_SQL, (
+                student_id, satisfaction, attendance, failed_courses, commute,
+                disciplinary, homework, family_income, promotion_status
+            ))
+        _bump_students_version()
+        return True
+    except Exception as e:
+        st.error(f"Database error: {e}")
+        return False
+
+def insert_students_bulk(rows):
+    """Insert many student rows in a single transaction"""
+    try:
+        conn = get_conn()
+        with get_write_lock(), conn:
+            conn.executemany(INSERT_STUDENT_SQL, rows)
+        _bump_students_version()
         return True
     except Exception as e:
         st.error(f"Database error: {e}")
         return False
 
+def score_batch_csv(uploaded_file):
+    """Read, validate and score a batch CSV; returns (scored rows, skipped count)"""
+    try:
+        batch_df = pd.read_csv(uploaded_file)
+        missing = [c for c in BATCH_COLUMNS if c not in batch_df.columns]
+        if missing:
+            st.error(f"Missing columns: {', '.join(missing)}")
+            return None, 0
+        
+        batch_df = batch_df[BATCH_COLUMNS].copy()
+        numeric_columns = BATCH_COLUMNS[:-1]
+        for col in numeric_columns:
+            batch_df[col] = pd.to_numeric(batch_df[col], errors='coerce')
+        batch_df['family_income'] = (
+            batch_df['family_income'].astype('string').str.strip().str.lower().astype(object)
+        )
+        
+        # Finite, whole where stored as INTEGER, inside the form's ranges, and a
+        # student_id that fits SQLite's signed 64-bit INTEGER without wrapping
+        valid = (
+            np.isfinite(batch_df[numeric_columns]).all(axis=1) &
+            (batch_df[BATCH_INTEGER_COLUMNS] % 1 == 0).all(axis=1) &
+            batch_df['student_id'].ge(1) & batch_df['student_id'].lt(2.0 ** 63) &
+            batch_df['family_income'].isin(INCOME_LEVELS)
+        )
+        for col, (low, high) in INPUT_RANGES.items():
+            valid &= batch_df[col].between(low, high)
+        batch_df = batch_df[valid].astype(
+            {c: 'int64' if c in BATCH_INTEGER_COLUMNS else 'float64' for c in numeric_columns}
+        )
+        batch_df = batch_df.assign(promotion_status=predict_promotion_vec(
+            *(batch_df[c].to_numpy() for c in BATCH_COLUMNS[1:-1])
+        ))
+        return batch_df, int((~valid).sum())
+    except Exception as e:
+        st.error(f"Error processing CSV: {e}")
+        return None, 0
+
+def _bump_students_version():
+    """Invalidate cached reads after the students table changes"""
+    st.session_state.students_version += 1
+
+def _fetch_students(query, params=()):
+    """Build a compact DataFrame straight from cursor rows, skipping read_sql type inference"""
+    cursor = get_read_conn().execute(query, params)
+    df = pd.DataFrame.from_records(
+        cursor.fetchall(), columns=[d[0] for d in cursor.description]
+    )
+    for col, dtype in STUDENT_DTYPES.items():
+        try:
+            df[col] = df[col].astype(dtype)
+        except (TypeError, ValueError):
+            # A stray REAL/TEXT value in an INTEGER column must not disable the page
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+@st.cache_data(ttl=60)
+def _load_students(version):
+    """Load the students table; `version` only serves as the cache key"""
+    return _fetch_students(SELECT_STUDENTS_SQL)
+
+def _filter_clause(statuses, incomes):
+    """WHERE clause and parameters for the View Database status/income filters"""
+    clause = "WHERE promotion_status IN ({}) AND family_income IN ({})".format(
+        ",".join("?" * len(statuses)), ",".join("?" * len(incomes))
+    )
+    return clause, [*statuses, *incomes]
+
+@st.cache_data(ttl=60)
+def _count_filtered_students(statuses, incomes, version):
+    """Number of students matching the filters, for the page selector"""
+    clause, params = _filter_clause(statuses, incomes)
+    return get_read_conn().execute(f"SELECT COUNT(*) FROM students {clause}", params).fetchone()[0]
+
+@st.cache_data(ttl=60)
+def _load_filtered_students(statuses, incomes, page_num, version):
+    """One page of filtered students; SQL does the filtering, ordering and slicing"""
+    clause, params = _filter_clause(statuses, incomes)
+    # student_id breaks timestamp ties (batch inserts share one) so pages never overlap
+    query = (
+        f"SELECT {STUDENT_COLUMNS} FROM students {clause} "
+        "ORDER BY prediction_date DESC, student_id LIMIT ? OFFSET ?"
+    )
+    return _fetch_students(query, [*params, PAGE_SIZE, (page_num - 1) * PAGE_SIZE])
+
+@st.cache_data(ttl=60)
+def _group_counts(column, version):
+    """Row counts per distinct value of `column`, computed by SQLite"""
+    counts = pd.read_sql_query(
+        f"SELECT {column}, COUNT(*) AS count FROM students "
+        f"GROUP BY {column} ORDER BY count DESC",
+        get_read_conn(),
+        index_col=column
+    )
+    return counts['count']
+
+@st.cache_data(ttl=60)
+def _status_counts(version):
+    """{promotion_status: count} for the Home page metrics"""
+    return dict(get_read_conn().execute(STATUS_COUNTS_SQL).fetchall())
+
+@st.cache_data(ttl=60)
+def _failed_course_counts(version):
+    """Failed-course histogram bins per status, pre-aggregated by SQLite"""
+    return pd.read_sql_query(
+        "SELECT failed_courses, promotion_status, COUNT(*) AS count FROM students "
+        "GROUP BY failed_courses, promotion_status",
+        get_read_conn()
+    )
+
+@st.cache_data(ttl=60)
+def _view_metrics(version):
+    """(total, avg attendance, avg satisfaction, at risk) in one table scan"""
+    return get_read_conn().execute(VIEW_METRICS_SQL).fetchone()
+
+@st.cache_data(ttl=60)
+def _average_metrics_by_status(version):
+    """Per-status averages for the Analytics page, computed by SQLite"""
+    return pd.read_sql_query(
+        "SELECT promotion_status, "
+        "AVG(school_satisfaction) AS school_satisfaction, "
+        "AVG(attendance_rate) AS attendance_rate, "
+        "AVG(failed_courses) AS failed_courses, "
+        "AVG(homework_completion) AS homework_completion "
+        "FROM students GROUP BY promotion_status",
+        get_read_conn(),
+        index_col='promotion_status'
+    ).round(2)
+
 def get_all_students():
     """Retrieve all students from database"""
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
-        df = pd.read_sql_query("SELECT * FROM students ORDER BY prediction_date DESC", conn)
-        conn.close()
-        return df
+        return _load_students(st.session_state.students_version)
     except Exception as e:
         st.error(f"Error retrieving data: {e}")
         return pd.DataFrame()
 
+def count_filtered_students(status_filter, income_filter):
+    """Count students matching the selected statuses and income levels"""
+    try:
+        return _count_filtered_students(
+            tuple(sorted(status_filter)), tuple(sorted(income_filter)),
+            st.session_state.students_version
+        )
+    except Exception as e:
+        st.error(f"Error retrieving data: {e}")
+        return 0
+
+def get_filtered_students(status_filter, income_filter, page_num=1):
+    """Retrieve one page of students matching the selected statuses and income levels"""
+    try:
+        return _load_filtered_students(
+            tuple(sorted(status_filter)), tuple(sorted(income_filter)), page_num,
+            st.session_state.students_version
+        )
+    except Exception as e:
+        st.error(f"Error retrieving data: {e}")
+        return pd.DataFrame()
+
+def get_status_counts():
+    """Number of students per promotion status"""
+    try:
+        return _status_counts(st.session_state.students_version)
+    except Exception as e:
+        st.error(f"Error retrieving data: {e}")
+        return {}
+
+def get_view_metrics():
+    """Summary metrics for the View Database page"""
+    try:
+        return _view_metrics(st.session_state.students_version)
+    except Exception as e:
+        st.error(f"Error retrieving data: {e}")
+        return 0, 0, 0, 0
+
 def delete_student(student_id):
     """Delete student record"""
     try:
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM students WHERE student_id = ?', (student_id,))
-        conn.commit()
-        conn.close()
+        conn = get_conn()
+        with get_write_lock(), conn:
+            conn.execute(DELETE_STUDENT_SQL, (student_id,))
+        _bump_students_version()
         return True
     except Exception as e:
         st.error(f"Error deleting record: {e}")
         return False
 
-# Initialize database
-initialize_database()
+# Seed per session so a fresh session never reuses another session's stale entry
+if "students_version" not in st.session_state:
+    st.session_state.students_version = time.time_ns()
 
-# Sidebar navigation
-st.sidebar.title("🎓 Navigation")
-page = st.sidebar.radio("Go to", ["Home", "Predict Dropout", "View Database", "Analytics", "About"])
-
-# Main content based on page selection
-if page == "Home":
+# Pages; fragments rerun only their own body when one of their widgets changes
+@st.fragment
+def _home_page():
+    """Home page: headline counts and system overview"""
     st.title("🎓 Student Dropout Prediction System")
     st.markdown("---")
     
+    status_counts = get_status_counts()
+    total_students = sum(status_counts.values())
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Total Students", len(get_all_students()))
+        st.metric("Total Students", total_students)
     
     with col2:
-        df = get_all_students()
-        if not df.empty:
-            at_risk = len(df[df['promotion_status'] == 'At Risk of Dropout'])
-            st.metric("At Risk Students", at_risk)
+        if total_students:
+            st.metric("At Risk Students", status_counts.get('At Risk of Dropout', 0))
     
     with col3:
-        if not df.empty:
-            promoted = len(df[df['promotion_status'] == 'Promoted'])
-            st.metric("Promoted Students", promoted)
+        if total_students:
+            st.metric("Promoted Students", status_counts.get('Promoted', 0))
     
     st.markdown("---")
     st.subheader("📊 About This System")
@@ -138,7 +469,9 @@ if page == "Home":
     Use the sidebar to navigate between different features.
     """)
 
-elif page == "Predict Dropout":
+@st.fragment
+def _predict_page():
+    """Predict page: single-student form and CSV batch scoring"""
     st.title("🔮 Student Dropout Prediction")
     st.markdown("---")
     
@@ -146,15 +479,15 @@ elif page == "Predict Dropout":
     
     with col1:
         student_id = st.number_input("Student ID", min_value=1, step=1, value=1)
-        satisfaction = st.slider("School Satisfaction (1-5)", 1.0, 5.0, 3.0, 0.1)
-        attendance = st.slider("Attendance Rate (%)", 0.0, 100.0, 75.0, 1.0)
-        failed_courses = st.number_input("Failed Courses", min_value=0, max_value=10, value=0)
+        satisfaction = st.slider("School Satisfaction (1-5)", *INPUT_RANGES['school_satisfaction'], 3.0, 0.1)
+        attendance = st.slider("Attendance Rate (%)", *INPUT_RANGES['attendance_rate'], 75.0, 1.0)
+        failed_courses = st.number_input("Failed Courses", *INPUT_RANGES['failed_courses'], value=0)
     
     with col2:
-        commute = st.slider("Commute Time (minutes)", 1, 120, 30, 1)
-        disciplinary = st.number_input("Disciplinary Incidents", min_value=0, max_value=10, value=0)
-        homework = st.slider("Homework Completion (%)", 0.0, 100.0, 85.0, 1.0)
-        family_income = st.selectbox("Family Income Level", ["low", "medium", "high"])
+        commute = st.slider("Commute Time (minutes)", *INPUT_RANGES['commute_time'], 30, 1)
+        disciplinary = st.number_input("Disciplinary Incidents", *INPUT_RANGES['disciplinary_incidents'], value=0)
+        homework = st.slider("Homework Completion (%)", *INPUT_RANGES['homework_completion'], 85.0, 1.0)
+        family_income = st.selectbox("Family Income Level", INCOME_LEVELS)
     
     st.markdown("---")
     
@@ -177,67 +510,89 @@ elif page == "Predict Dropout":
             
             # Show factors
             st.subheader("📈 Contributing Factors")
+            values = (satisfaction, attendance, failed_courses, commute, disciplinary, homework)
             factors = {
-                "School Satisfaction": f"{satisfaction}/5 {'✅' if satisfaction > 3 else '❌'}",
-                "Attendance Rate": f"{attendance}% {'✅' if attendance > 70 else '❌'}",
-                "Failed Courses": f"{failed_courses} {'✅' if failed_courses <= 2 else '❌'}",
-                "Commute Time": f"{commute} min {'✅' if commute <= 40 else '❌'}",
-                "Disciplinary Cases": f"{disciplinary} {'✅' if disciplinary <= 2 else '❌'}",
-                "Homework Completion": f"{homework}% {'✅' if homework > 80 else '❌'}"
+                label: f"{value}{suffix} {'✅' if passes(value, threshold) else '❌'}"
+                for (label, suffix, threshold, passes), value in zip(FACTORS, values)
             }
             
             for factor, value in factors.items():
                 st.write(f"**{factor}:** {value}")
+    
+    st.markdown("---")
+    st.subheader("📄 Batch Predict from CSV")
+    st.caption(f"Expected columns: {', '.join(BATCH_COLUMNS)}. Ranges: "
+               + ", ".join(f"{col} {low}-{high}" for col, (low, high) in INPUT_RANGES.items()))
+    uploaded_file = st.file_uploader("Upload student records", type="csv")
+    
+    if uploaded_file is not None and st.button("🎯 Predict & Save Batch", use_container_width=True):
+        batch_df, skipped = score_batch_csv(uploaded_file)
+        
+        if skipped:
+            st.warning(f"Skipped {skipped} rows with missing, non-numeric or out-of-range values "
+                       f"(see the ranges above; integer fields must be whole numbers; income must be "
+                       f"one of {', '.join(INCOME_LEVELS)})")
+        
+        if batch_df is not None:
+            if batch_df.empty:
+                st.error("No valid rows to save")
+            elif insert_students_bulk(list(batch_df.itertuples(index=False, name=None))):
+                st.success(f"✅ Saved predictions for {len(batch_df)} students")
+                st.dataframe(batch_df, use_container_width=True)
 
-elif page == "View Database":
+@st.fragment
+def _view_page():
+    """View Database page: metrics, filtered records and deletion"""
     st.title("📁 Student Database")
     st.markdown("---")
     
-    # Get all students
-    df = get_all_students()
+    total_records, avg_attendance, avg_satisfaction, at_risk = get_view_metrics()
     
-    if df.empty:
+    if not total_records:
         st.info("No student records found. Add predictions to see data here.")
     else:
         # Display statistics
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Total Records", len(df))
+            st.metric("Total Records", total_records)
         with col2:
-            avg_attendance = df['attendance_rate'].mean()
             st.metric("Avg Attendance", f"{avg_attendance:.1f}%")
         with col3:
-            at_risk = len(df[df['promotion_status'] == 'At Risk of Dropout'])
             st.metric("At Risk", at_risk)
         with col4:
-            avg_satisfaction = df['school_satisfaction'].mean()
             st.metric("Avg Satisfaction", f"{avg_satisfaction:.1f}/5")
         
         st.markdown("---")
         
         # Filter options
+        version = st.session_state.students_version
+        # NULLs can never match an IN (...) filter, so they are not offered as options
+        status_options = list(_group_counts('promotion_status', version).index.dropna())
+        income_options = list(_group_counts('family_income', version).index.dropna())
         col1, col2 = st.columns(2)
         with col1:
             status_filter = st.multiselect(
                 "Filter by Status",
-                options=df['promotion_status'].unique(),
-                default=df['promotion_status'].unique()
+                options=status_options,
+                default=status_options
             )
         with col2:
             income_filter = st.multiselect(
                 "Filter by Income",
-                options=df['family_income'].unique(),
-                default=df['family_income'].unique()
+                options=income_options,
+                default=income_options
             )
         
-        # Apply filters
-        filtered_df = df[
-            (df['promotion_status'].isin(status_filter)) &
-            (df['family_income'].isin(income_filter))
-        ]
+        # Apply filters, fetching only the selected page
+        total_matches = count_filtered_students(status_filter, income_filter)
+        page_count = max(1, -(-total_matches // PAGE_SIZE))
+        page_num = st.number_input("Page", min_value=1, max_value=page_count, value=1)
+        filtered_df = get_filtered_students(status_filter, income_filter, page_num)
         
         # Display dataframe
         st.dataframe(filtered_df, use_container_width=True)
+        st.caption(f"Showing {len(filtered_df)} of {total_matches} matching records "
+                   f"(page {page_num} of {page_count})")
         
         # Delete student option
         st.markdown("---")
@@ -251,7 +606,11 @@ elif page == "View Database":
                     st.success(f"Student {delete_id} deleted successfully!")
                     st.rerun()
 
-elif page == "Analytics":
+@st.fragment
+def _analytics_page():
+    """Analytics page: distributions and per-status averages"""
+    import plotly.express as px
+    
     st.title("📊 Analytics Dashboard")
     st.markdown("---")
     
@@ -260,19 +619,22 @@ elif page == "Analytics":
     if df.empty:
         st.info("No data available for analytics. Add student predictions first.")
     else:
+        version = st.session_state.students_version
+        status_counts = _group_counts('promotion_status', version)
+        income_counts = _group_counts('family_income', version)
+        avg_by_status = _average_metrics_by_status(version)
+        
         # Status distribution
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Promotion Status Distribution")
-            status_counts = df['promotion_status'].value_counts()
             fig = px.pie(values=status_counts.values, names=status_counts.index,
                         color_discrete_sequence=['#00509e', '#d9534f'])
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             st.subheader("Income Level Distribution")
-            income_counts = df['family_income'].value_counts()
             fig = px.bar(x=income_counts.index, y=income_counts.values,
                         labels={'x': 'Income Level', 'y': 'Count'},
                         color=income_counts.index)
@@ -283,8 +645,9 @@ elif page == "Analytics":
         col1, col2 = st.columns(2)
         
         with col1:
-            # Attendance vs Satisfaction
-            fig = px.scatter(df, x='attendance_rate', y='school_satisfaction',
+            # Attendance vs Satisfaction, sampled so large tables stay responsive
+            plot_df = df if len(df) <= PLOT_MAX_POINTS else df.sample(PLOT_MAX_POINTS, random_state=0)
+            fig = px.scatter(plot_df, x='attendance_rate', y='school_satisfaction',
                            color='promotion_status',
                            labels={'attendance_rate': 'Attendance Rate (%)',
                                   'school_satisfaction': 'School Satisfaction'},
@@ -292,23 +655,19 @@ elif page == "Analytics":
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
-            # Failed courses distribution
-            fig = px.histogram(df, x='failed_courses', color='promotion_status',
-                             labels={'failed_courses': 'Number of Failed Courses'},
-                             title='Failed Courses Distribution')
+            # Failed courses distribution, binned in SQL
+            failed_counts = _failed_course_counts(version)
+            fig = px.bar(failed_counts, x='failed_courses', y='count', color='promotion_status',
+                         labels={'failed_courses': 'Number of Failed Courses'},
+                         title='Failed Courses Distribution')
             st.plotly_chart(fig, use_container_width=True)
         
         # Average metrics by status
         st.subheader("📊 Average Metrics by Status")
-        avg_by_status = df.groupby('promotion_status').agg({
-            'school_satisfaction': 'mean',
-            'attendance_rate': 'mean',
-            'failed_courses': 'mean',
-            'homework_completion': 'mean'
-        }).round(2)
         st.dataframe(avg_by_status, use_container_width=True)
 
-else:  # About page
+def _about_page():
+    """About page"""
     st.title("ℹ️ About This Project")
     st.markdown("---")
     
@@ -320,15 +679,10 @@ else:  # About page
     """)
     
     st.subheader("🔍 Prediction Criteria")
-    st.write("""
-    A student is considered **Promoted** if they meet ALL of the following criteria:
-    - School Satisfaction > 3 (out of 5)
-    - Attendance Rate > 70%
-    - Failed Courses ≤ 2
-    - Commute Time ≤ 40 minutes
-    - Disciplinary Incidents ≤ 2
-    - Homework Completion > 80%
-    """)
+    symbols = {operator.gt: '>', operator.le: '≤'}
+    st.write("A student is considered **Promoted** if they meet ALL of the following criteria:\n" + "\n".join(
+        f"- {label} {symbols[passes]} {threshold}{suffix}" for label, suffix, threshold, passes in FACTORS
+    ))
     
     st.subheader("🛠️ Technology Stack")
     st.write("""
@@ -343,6 +697,22 @@ else:  # About page
     st.write("**Managed By The Whiskers**")
     st.write("Powered by Python & Streamlit")
 
+# Sidebar navigation
+st.sidebar.title("🎓 Navigation")
+page = st.sidebar.radio("Go to", ["Home", "Predict Dropout", "View Database", "Analytics", "About"])
+
+# Main content based on page selection
+if page == "Home":
+    _home_page()
+elif page == "Predict Dropout":
+    _predict_page()
+elif page == "View Database":
+    _view_page()
+elif page == "Analytics":
+    _analytics_page()
+else:  # About page
+    _about_page()
+
 # Footer
 st.sidebar.markdown("---")
 st.sidebar.info("🎓 Student Dropout Predictor v1.0")